@@ -1,7 +1,7 @@
 import ast
 import asyncio
 import functools
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, ForwardRef, List, Optional, Tuple, Union, get_args
 
 from IPython.core.getipython import get_ipython
 from IPython.core.interactiveshell import InteractiveShell
@@ -15,15 +15,37 @@ from pydantic import (
 _RUNTYPE_WRAPPER = "_runtype"
 _RUNTYPE_ENABLED = "_runtype_enabled"
 _RUNTYPE_CONFIG = "_runtype_config"
+_RUNTYPE_TRANSFORMER = "_runtype_transformer"
 _RUNTYPE_EXCLUSION = "_no_runtype"
+_NO_RUNTYPE_DECORATOR = "no_runtype"
+
+# AST fields holding statement lists (or except handlers and match cases wrapping them)
+_STATEMENT_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
+# Validators built by `validate_call`, reused when an unchanged function is redefined (e.g. a cell is re-run).
+# Each entry keeps its function alive, so the cache is bounded (oldest entries are evicted first)
+_VALIDATED_CACHE: Dict[Tuple[Any, ...], Callable[..., Any]] = {}
+_VALIDATED_CACHE_SIZE = 1024
+_UNHASHABLE = object()
+# Default values of these types are keyed by type and value, all others by identity
+_VALUE_KEYED_TYPES = (type(None), bool, int, float, complex, str, bytes)
 
 
 class RuntypeError(Exception):
+    __slots__ = ("errors", "original_exception", "_msg")
+
     def __init__(self, errors: List[Any], original_exception: Optional[Exception] = None):
         self.errors = errors
         self.original_exception = original_exception
-        message = self._format_errors(errors)
-        super().__init__(message)
+        super().__init__(errors)
+
+    def __str__(self) -> str:
+        # Format lazily and only once, errors caught and handled without printing never pay for it
+        try:
+            return self._msg
+        except AttributeError:
+            self._msg = self._format_errors(self.errors)
+            return self._msg
 
     @staticmethod
     def _format_errors(errors: List[Any]) -> str:
@@ -39,25 +61,198 @@ class RuntypeError(Exception):
         return "\n".join(lines)
 
 
+def _is_trivial(node: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> bool:
+    """
+    Check whether `node` only returns a name or constant (after an optional docstring)
+    and all of its annotations are plain (possibly dotted) names.
+    """
+    body = node.body
+    if body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant):
+        body = body[1:]
+    if len(body) != 1 or not isinstance(body[0], ast.Return):
+        return False
+    if body[0].value is not None and not isinstance(body[0].value, (ast.Name, ast.Constant)):
+        return False
+    args = node.args
+    params = args.posonlyargs + args.args + args.kwonlyargs + [arg for arg in (args.vararg, args.kwarg) if arg]
+    annotations = [param.annotation for param in params] + [node.returns]
+    return all(ann is None or isinstance(ann, (ast.Name, ast.Attribute)) for ann in annotations)
+
+
 class RuntypeASTDecorator(ast.NodeTransformer):
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> ast.FunctionDef:
-        # Insert _RUNTYPE_WRAPPER as the first decorator, if not present
+    def __init__(self, skip_trivial: bool = False) -> None:
+        self.skip_trivial = skip_trivial
+
+    def generic_visit(self, node: ast.AST) -> ast.AST:
+        # Function definitions only appear in statement lists, so expression subtrees are never descended into
+        for field in _STATEMENT_FIELDS:
+            stmts = getattr(node, field, None)
+            if isinstance(stmts, list):
+                for stmt in stmts:
+                    self.visit(stmt)
+        return node
+
+    def _ensure_decorator(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> None:
+        # Skip functions marked with `@no_runtype` (or `@module.no_runtype`). This is a syntactic check,
+        # aliased markers are still excluded at runtime by `_runtype`
         for deco in node.decorator_list:
-            if getattr(deco, "id", None) == _RUNTYPE_WRAPPER:
-                break
-        else:
-            node.decorator_list.insert(0, ast.Name(id=_RUNTYPE_WRAPPER, ctx=ast.Load()))
+            if (
+                getattr(deco, "id", None) == _NO_RUNTYPE_DECORATOR
+                or getattr(deco, "attr", None) == _NO_RUNTYPE_DECORATOR
+            ):
+                return
+        # Optionally skip functions whose body is too trivial to be worth the validation overhead
+        if self.skip_trivial and _is_trivial(node):
+            return
+        # Insert _RUNTYPE_WRAPPER as the first decorator, if not present
+        if not any(getattr(deco, "id", None) == _RUNTYPE_WRAPPER for deco in node.decorator_list):
+            deco = ast.copy_location(ast.Name(id=_RUNTYPE_WRAPPER, ctx=ast.Load()), node)
+            node.decorator_list.insert(0, deco)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> ast.FunctionDef:
+        self._ensure_decorator(node)
         return node
 
     def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> ast.AsyncFunctionDef:
-        for deco in node.decorator_list:
-            if getattr(deco, "id", None) == _RUNTYPE_WRAPPER:
-                break
-        else:
-            node.decorator_list.insert(0, ast.Name(id=_RUNTYPE_WRAPPER, ctx=ast.Load()))
+        self._ensure_decorator(node)
         return node
 
 
+def _has_forward_ref(annotation: Any) -> bool:
+    """
+    Check whether `annotation` is, or contains (e.g. `Optional["Foo"]`), a forward reference.
+    """
+    if isinstance(annotation, (str, ForwardRef)):
+        return True
+    if isinstance(annotation, (list, tuple)):
+        return any(_has_forward_ref(arg) for arg in annotation)
+    args = get_args(annotation) + tuple(getattr(annotation, "__metadata__", ()))
+    return any(_has_forward_ref(arg) for arg in args)
+
+
+def _annotation_key(annotation: Any) -> Any:
+    """
+    Hashable stand-in for `annotation` in `_VALIDATED_CACHE` keys.
+    """
+    try:
+        hash(annotation)
+    except TypeError:
+        return (_UNHASHABLE, id(annotation))
+    return annotation
+
+
+def _default_key(default: Any) -> Any:
+    """
+    Stand-in for a default value in `_VALIDATED_CACHE` keys.
+    The type is part of the key so that equal values of different types (`1`, `1.0`, `True`) do not collide,
+    other objects are keyed by identity, which is safe because the cached validator keeps them alive.
+    """
+    if type(default) in _VALUE_KEYED_TYPES:
+        return (type(default), default)
+    return (_UNHASHABLE, id(default))
+
+
+def _validated_cache_key(func: Callable[..., Any], config: ConfigDict) -> Optional[Tuple[Any, ...]]:
+    """
+    Build the `_VALIDATED_CACHE` key for `func` under `config`.
+    Returns `None` if the function cannot be safely cached: closures, and annotations containing forward references
+    anywhere (e.g. `Optional["Foo"]`), since Pydantic resolves them by name when the validator is built.
+    The remaining annotations are fully resolved, so keying unhashable ones by identity is safe (the cached validator
+    keeps them alive) and still matches annotations shared through a type alias defined in another cell.
+    """
+    code = getattr(func, "__code__", None)
+    if code is None or getattr(func, "__closure__", None):
+        return None
+    if any(_has_forward_ref(ann) for ann in func.__annotations__.values()):
+        return None
+    # The filename is not part of code object equality, it keeps identical definitions from different cells apart
+    return (
+        code,
+        code.co_filename,
+        func.__qualname__,
+        tuple(_default_key(default) for default in func.__defaults__ or ()),
+        tuple((name, _default_key(default)) for name, default in sorted((func.__kwdefaults__ or {}).items())),
+        tuple((name, _annotation_key(ann)) for name, ann in func.__annotations__.items()),
+        tuple(sorted(config.items())),
+    )
+
+
+def _schema_error_func(error: PydanticSchemaGenerationError) -> Callable[..., Any]:
+    """
+    Stand-in for a validator that could not be built, raising a `RuntypeError` for the schema `error` when called.
+    """
+
+    def raise_schema_error(*args: Any, **kwargs: Any) -> Any:
+        raise RuntypeError([{"msg": "Failed to generate Pydantic schema"}], original_exception=error) from error
+
+    return raise_schema_error
+
+
+def _build_validator(func: Callable[..., Any], config: ConfigDict) -> Callable[..., Any]:
+    """
+    Build (or reuse a cached) `validate_call` validator for `func`.
+    Schema errors are deferred until the validator is called.
+    """
+    key = _validated_cache_key(func, config)
+    validated = _VALIDATED_CACHE.get(key) if key is not None else None
+    if validated is None:
+        try:
+            validated = validate_call(config=config, validate_return=config["validate_return"])(func)
+        except PydanticSchemaGenerationError as e:
+            validated = _schema_error_func(e)
+        else:
+            if key is not None:
+                if len(_VALIDATED_CACHE) >= _VALIDATED_CACHE_SIZE:
+                    del _VALIDATED_CACHE[next(iter(_VALIDATED_CACHE))]
+                _VALIDATED_CACHE[key] = validated
+    return validated
+
+
+def _make_sync_wrapper(func: Callable[..., Any], build: Callable[[], Callable[..., Any]]) -> Callable[..., Any]:
+    """
+    Wrap `func` so calls go through the validator returned by `build`, translating Pydantic errors into
+    `RuntypeError`. The validator is built on the first call, functions never called never pay for it.
+    """
+    validated: Optional[Callable[..., Any]] = None
+    # Bind exception classes as closure variables to avoid global lookups on every call
+    _RuntypeError = RuntypeError
+    _ValidationError = ValidationError
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        nonlocal validated
+        if validated is None:
+            validated = build()
+        try:
+            return validated(*args, **kwargs)
+        except _ValidationError as e:
+            raise _RuntypeError(e.errors(), original_exception=e) from e
+
+    return wrapper
+
+
+def _make_async_wrapper(func: Callable[..., Any], build: Callable[[], Callable[..., Any]]) -> Callable[..., Any]:
+    """
+    Async counterpart of `_make_sync_wrapper`.
+    """
+    validated: Optional[Callable[..., Any]] = None
+    # Bind exception classes as closure variables to avoid global lookups on every call
+    _RuntypeError = RuntypeError
+    _ValidationError = ValidationError
+
+    @functools.wraps(func)
+    async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+        nonlocal validated
+        if validated is None:
+            validated = build()
+        try:
+            return await validated(*args, **kwargs)
+        except _ValidationError as e:
+            raise _RuntypeError(e.errors(), original_exception=e) from e
+
+    return async_wrapper
+
+
 def _get_ipython_context() -> InteractiveShell:
     """
     Get the current IPython `InteractiveShell` instance.
@@ -73,7 +268,7 @@ def _is_runtype_enabled(ip: InteractiveShell) -> bool:
     """
     Check if `runtype` is enabled in the given IPython instance.
     """
-    return hasattr(ip, _RUNTYPE_ENABLED)
+    return _RUNTYPE_ENABLED in ip.__dict__
 
 
 def enable_runtype(
@@ -82,6 +277,7 @@ def enable_runtype(
     validate_return: bool = True,
     validate_default: bool = True,
     arbitrary_types_allowed: bool = True,
+    skip_trivial: bool = False,
 ) -> None:
     """
     Enable automatic decoration of all subsequent function definitions with Pydantic's @validate_call.
@@ -90,18 +286,18 @@ def enable_runtype(
         validate_return (bool): Validate return values.
         validate_default (bool): Validate default values.
         arbitrary_types_allowed (bool): Allow arbitrary types.
+        skip_trivial (bool): Do not validate functions that only return a name or constant
+            and whose annotations are plain names.
     Usage:
         enable_runtype()
     """
     # Validate parameters
-    if not all(
-        isinstance(param, bool)
-        for param in [
-            strict,
-            validate_return,
-            validate_default,
-            arbitrary_types_allowed,
-        ]
+    if not (
+        type(strict) is bool
+        and type(validate_return) is bool
+        and type(validate_default) is bool
+        and type(arbitrary_types_allowed) is bool
+        and type(skip_trivial) is bool
     ):
         raise TypeError("All parameters must be boolean values")
 
@@ -120,6 +316,7 @@ def enable_runtype(
         "validate_default": validate_default,
         "arbitrary_types_allowed": arbitrary_types_allowed,
     }
+    runtype_config: Dict[str, Any] = {**config, "skip_trivial": skip_trivial}
 
     # Define the custom decorator
     def _runtype(func: Callable[..., Any]) -> Callable[..., Any]:
@@ -127,45 +324,16 @@ def enable_runtype(
         if getattr(func, _RUNTYPE_EXCLUSION, False):
             return func
 
-        def get_validated_func() -> Callable[..., Any]:
-            return validate_call(config=config, validate_return=validate_return)(func)
+        # Nothing to validate without annotations (or with only `Any`/`object` ones), skip validate_call and the wrapper
+        ann = getattr(func, "__annotations__", None) or {}
+        if all(hint is Any or hint is object for name, hint in ann.items() if validate_return or name != "return"):
+            return func
 
+        # The validator is built lazily, on the first call
+        build = functools.partial(_build_validator, func, config)
         if asyncio.iscoroutinefunction(func):
-
-            @functools.wraps(func)
-            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-                try:
-                    validated = get_validated_func()
-                    return await validated(*args, **kwargs)
-                except ValidationError as e:
-                    raise RuntypeError(e.errors(), original_exception=e) from e
-                except PydanticSchemaGenerationError as e:
-                    raise RuntypeError(
-                        [{"msg": "Failed to generate Pydantic schema"}],
-                        original_exception=e,
-                    ) from e
-                except Exception as e:
-                    raise e
-
-            return async_wrapper
-        else:
-
-            @functools.wraps(func)
-            def wrapper(*args: Any, **kwargs: Any) -> Any:
-                try:
-                    validated = get_validated_func()
-                    return validated(*args, **kwargs)
-                except ValidationError as e:
-                    raise RuntypeError(e.errors(), original_exception=e) from e
-                except PydanticSchemaGenerationError as e:
-                    raise RuntypeError(
-                        [{"msg": "Failed to generate Pydantic schema"}],
-                        original_exception=e,
-                    ) from e
-                except Exception as e:
-                    raise e
-
-            return wrapper
+            return _make_async_wrapper(func, build)
+        return _make_sync_wrapper(func, build)
 
     # Inject the custom decorator into user/global namespace
     try:
@@ -175,16 +343,18 @@ def enable_runtype(
 
     # Register the AST transformer
     try:
-        ip.ast_transformers.append(RuntypeASTDecorator())
-        setattr(ip, _RUNTYPE_ENABLED, True)
-        setattr(ip, _RUNTYPE_CONFIG, config)
+        transformer = RuntypeASTDecorator(skip_trivial=skip_trivial)
+        ip.ast_transformers.append(transformer)
+        ip.__dict__[_RUNTYPE_TRANSFORMER] = transformer
+        ip.__dict__[_RUNTYPE_ENABLED] = True
+        ip.__dict__[_RUNTYPE_CONFIG] = runtype_config
     except Exception as e:
         # Clean up if transformer registration fails
         if _RUNTYPE_WRAPPER in ip.user_ns:
             del ip.user_ns[_RUNTYPE_WRAPPER]
         raise RuntimeError(f"Failed to register AST transformer: {e}") from e
 
-    print(f"runtype enabled with config={config}")
+    print(f"runtype enabled with config={runtype_config}")
 
 
 def disable_runtype() -> None:
@@ -199,20 +369,25 @@ def disable_runtype() -> None:
         print("runtype is not enabled.")
         return
 
-    # Remove AST transformers
-    if hasattr(ip, "ast_transformers"):
-        ip.ast_transformers[:] = [t for t in ip.ast_transformers if not isinstance(t, RuntypeASTDecorator)]
+    # Remove the registered AST transformer
+    transformer = ip.__dict__.pop(_RUNTYPE_TRANSFORMER, None)
+    if transformer is not None:
+        try:
+            ip.ast_transformers.remove(transformer)
+        except ValueError:
+            pass
 
     # Clean up attributes
-    if hasattr(ip, _RUNTYPE_ENABLED):
-        delattr(ip, _RUNTYPE_ENABLED)
-    if hasattr(ip, _RUNTYPE_CONFIG):
-        delattr(ip, _RUNTYPE_CONFIG)
+    ip.__dict__.pop(_RUNTYPE_ENABLED, None)
+    ip.__dict__.pop(_RUNTYPE_CONFIG, None)
 
     # Remove decorator from namespace
     if _RUNTYPE_WRAPPER in ip.user_ns:
         del ip.user_ns[_RUNTYPE_WRAPPER]
 
+    # Drop cached validators
+    _VALIDATED_CACHE.clear()
+
     print("runtype disabled.")
 
 
@@ -245,7 +420,7 @@ def get_runtype_config() -> Dict[str, Any]:
     ip = _get_ipython_context()
     if not _is_runtype_enabled(ip):
         raise RuntimeError("runtype is not enabled.")
-    return getattr(ip, _RUNTYPE_CONFIG, {})
+    return ip.__dict__.get(_RUNTYPE_CONFIG, {})
 
 
 def no_runtype(func: Callable[..., Any]) -> Callable[..., Any]: